@@ -75,7 +75,7 @@ setupdict = dict(
         'License :: OSI Approved :: GNU General Public License v2 (GPLv2)',
 
         # Supported Python versions
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.5',
     ],
 
     # What does your project relate to?
@@ -112,6 +112,9 @@ setupdict = dict(
     #    'dev': ['check-manifest'],
     #    'test': ['coverage'],
     #},
+    extras_require={
+        'fast': ['orjson'],
+    },
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.  If using Python 2.6 or less, then these
@@ -16,19 +16,20 @@
 # To contact SUSE about this file by physical or electronic mail,
 # you may find current contact information at www.suse.com
 
-import copy
 import dapsenv.configmanager as configmanager
 import dapsenv.xslt as xslt
 import grp
-import json
+import itertools
 import os
 import pwd
 import re
+import shlex
 import sys
 import threading
 import time
 from base64 import b64encode
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dapsenv.actions.action import Action
 from dapsenv.apiserver import APIServer
 from dapsenv.autobuildconfig import AutoBuildConfig, _dcfiles_pattern
@@ -45,9 +46,13 @@ from dapsenv.general import DAEMON_DEFAULT_INTERVAL, BUILDS_DIR, DAEMON_DEFAULT_
 from dapsenv.ircbot import IRCBot
 from dapsenv.logmanager import log
 from dapsenv.logserver import LogServer
+from dapsenv.utils import AtomicInt, dumpJSON, loadJSON
 from http.server import HTTPServer
 from socket import gethostname
 
+# an immutable view on the parts of a project which are needed to build it
+ProjectSnapshot = namedtuple("ProjectSnapshot", "vcs_repodir notifications project vcs_branch")
+
 class Daemon(Action):
     def __init__(self):
         pass
@@ -68,7 +73,7 @@ class Daemon(Action):
         self._start_ircbot()
 
         # start api server
-        if self._api_server == "true":
+        if self._api_server_enabled:
             api = APIServer("0.0.0.0", self._api_server_port, self)
             api.serve()
 
@@ -96,19 +101,41 @@ class Daemon(Action):
         self._hostname = gethostname()
         self._auth = DaemonAuth(DAEMON_AUTH_PATH)
 
+        # all scheduled and running jobs, indexed by their job id
         self._daemon_info = {
-            "jobs": [],
-            "scheduled_builds": 0,
-            "running_builds": 0
+            "jobs": OrderedDict()
         }
+        self._job_id_counter = itertools.count(1)
+
+        # build counters - these can be read without holding the jobs lock
+        self._running_builds = AtomicInt()
+        self._scheduled_builds = AtomicInt()
 
         # create locks for thread-safe communications
         self._irclock = threading.Lock()
-        self._daemon_info_lock = threading.Lock()
+        self._jobs_lock = threading.Lock()
+
+        # signals the job manager that a job was added or a build slot got freed
+        self._jobs_cv = threading.Condition(self._jobs_lock)
+
+        # gets incremented on every change of the job list (guarded by the jobs lock)
+        self._status_version = 0
+
+        # the result of getJobList(), rebuilt after the job list has changed
+        self._job_list_cache = None
+
+        # callbacks which get invoked on every change of the job list
+        self._status_listeners = []
 
         # load daemon settings
         self.loadDaemonSettings()
 
+        # worker threads which run the builds - one per container
+        self._build_pool = ThreadPoolExecutor(max_workers=self._max_containers)
+
+        # a single worker which sends build notifications in the order of their submission
+        self._notify_pool = ThreadPoolExecutor(max_workers=1)
+
         # load irc bot config
         self.loadIRCBotConfig()
 
@@ -180,52 +207,70 @@ class Daemon(Action):
         thread = threading.Thread(target=self._jobManager)
         thread.start()
 
-        # run check
-        self.check()
+        # run checks in a fixed interval - the monotonic clock is not affected by changes
+        # of the system time
+        next_check = time.monotonic()
 
         while True:
-            time.sleep(self._interval)
             self.check()
 
+            # skip missed checks if a check took longer than the interval
+            next_check = max(next_check + self._interval, time.monotonic())
+
+            delay = next_check - time.monotonic()
+            self._print("Next scheduled check: {}".format(time.ctime(time.time() + delay)))
+
+            if delay > 0:
+                time.sleep(delay)
+
     def _jobManager(self):
         while True:
-            # get a list of all available jobs
-            self._daemon_info_lock.acquire()
-            running_builds = copy.copy(self._daemon_info["running_builds"])
-            jobs = copy.copy(self._daemon_info["jobs"])
-            self._daemon_info_lock.release()
-
-            # search for new jobs in queue
-            if running_builds < self._max_containers:
-                for idx, job in enumerate(jobs):
-                    if running_builds >= self._max_containers:
-                        break
+            with self._jobs_cv:
+                # sleep until a job can be started
+                self._jobs_cv.wait_for(self._hasDispatchableJob)
+                self._dispatchReadyJobs()
 
-                    if job["status"] == 0:
-                        # create thread
-                        thread = threading.Thread(
-                            target=self._process,
-                            args=(copy.copy(job["project"]), job["dc_file"][:])
-                        )
+    def _hasDispatchableJob(self):
+        """Checks if a scheduled job exists and a build slot is free
 
-                        # start thread
-                        thread.start()
-                        
-                        # update amount of running builds
-                        self._daemon_info_lock.acquire()
+        The caller has to hold the jobs lock.
 
-                        running_builds += 1
+        :return bool: True if a job can be started
+        """
 
-                        self._daemon_info["jobs"][idx]["status"] = 1
-                        self._daemon_info["jobs"][idx]["time_started"] = int(time.time())
-                        self._daemon_info["running_builds"] += 1
-                        self._daemon_info["scheduled_builds"] -= 1
+        if self._running_builds.get() >= self._max_containers:
+            return False
 
-                        self._daemon_info_lock.release()
-                    else:
-                        break
+        return any(job["status"] == 0 for job in self._daemon_info["jobs"].values())
+
+    def _dispatchReadyJobs(self):
+        """Starts scheduled jobs until all build slots are taken
+
+        The caller has to hold the jobs lock.
+        """
+
+        running_builds = self._running_builds.get()
+        now = int(time.time())
 
-            time.sleep(1)
+        for job in self._daemon_info["jobs"].values():
+            if running_builds >= self._max_containers:
+                break
+
+            if job["status"] == 0:
+                # update job status
+                job["status"] = 1
+                job["time_started"] = now
+                self._statusChanged()
+
+                # hand the job over to a build worker
+                future = self._build_pool.submit(
+                    self._process, job["job_id"], job["project_snapshot"], job["dc_file"]
+                )
+                future.add_done_callback(self._buildDone)
+
+                # update amount of running builds
+                running_builds = self._running_builds.add(1)
+                self._scheduled_builds.add(-1)
 
     def check(self):
         """Starts docker containers if a documentation got updated
@@ -236,78 +281,162 @@ class Daemon(Action):
         # check and refresh all repositories
         self._prepare_build_task()
 
-        self._print("Next scheduled check: {}".format(time.ctime(time.time()+self._interval)))
-
     def _prepare_build_task(self):
         """Goes through all specified repositories and updates those
         """
 
-        for i in self.projects:
+        if not self.projects:
+            return
+
+        # projects can share a working tree (e.g. different branches of one checkout) - those
+        # have to be updated one after another, only separate checkouts are updated in parallel
+        groups = OrderedDict()
+        for project in self.projects.values():
+            groups.setdefault(os.path.realpath(project["vcs_repodir"]), []).append(project)
+
+        with ThreadPoolExecutor(max_workers=min(32, len(groups))) as executor:
+            results = list(executor.map(self._updateProjectGroup, groups.values()))
+
+        new_jobs = [job for jobs in results for job in jobs]
+
+        if not new_jobs:
+            return
+
+        # schedule all builds at once
+        with self._jobs_cv:
+            for snapshot, dc_file, commit in new_jobs:
+                self._addJob(snapshot, dc_file, commit)
+
+            self._scheduled_builds.add(len(new_jobs))
+            self._statusChanged()
+            self._jobs_cv.notify_all()
+
+    def _updateProjectGroup(self, projects):
+        """Updates projects which share one working tree one after another
+
+        :param list projects: The projects of the working tree
+        :return list: A list of (ProjectSnapshot, DC file, commit hash) tuples to build
+        """
+
+        new_jobs = []
+
+        for project in projects:
+            new_jobs.extend(self._updateProject(project))
+
+        return new_jobs
+
+    def _updateProject(self, project):
+        """Updates the repository of a project and determines the DC files to rebuild
+
+        :param dict project: The project as returned by AutoBuildConfig.fetchProjects()
+        :return list: A list of (ProjectSnapshot, DC file, commit hash) tuples to build
+        """
+
+        new_jobs = []
+
+        # a failing repository must not affect the builds of the other projects
+        try:
             # pull new commits into repository
-            self.projects[i]["repo"].pull(self.projects[i]["vcs_branch"], force=True)
+            project["repo"].pull(project["vcs_branch"], force=True)
 
             # fetch current commit hash from branch
-            commit = self.projects[i]["repo"].getLastCommitHash(self.projects[i]["vcs_branch"])
+            commit = project["repo"].getLastCommitHash(project["vcs_branch"])
 
             # check if the last commit hash got changed
-            if self.projects[i]["vcs_lastrev"] != commit:
-                old_commit = self.projects[i]["vcs_lastrev"]
+            if project["vcs_lastrev"] == commit:
+                return new_jobs
 
-                # update to the new commit hash
-                self.projects[i]["vcs_lastrev"] = commit[:]
-                self.autoBuildConfig.updateCommitHash(self.projects[i]["project"], commit[:])
+            old_commit = project["vcs_lastrev"]
 
-                # get changed files
-                changed_files = []
+            # get changed files
+            changed_files = []
 
-                try:
-                    changed_files = self.projects[i]["repo"].getChangedFilesBetweenCommits(
-                        old_commit, commit
-                    )
-                except GitErrorException:
-                    pass
-
-                # determine assigned DC file for each changed file
-                for dc_file, dc_object in self.projects[i]["dc_files"].items():
-                    build = False
-
-                    if dc_object.rootid:
-                        try:
-                            assigned_files = xslt.getAllUsedFiles(
-                                "{}/xml/{}".format(self.projects[i]["vcs_repodir"], dc_object.main),
-                                dc_object.rootid
-                            )
-
-                            # is at least one element from "changed_files" in "assigned_files"
-                            res = lambda a, b: any(i in assigned_files for i in changed_files)
-
-                            if res:
-                                build = True
-                        except InvalidRootIDException:
-                            log.error("Invalid root id in main file '{}' of DC File '{}' specified. Repository: {}".format(
-                                dc_object.main, dc_file, self.projects[i]["vcs_repodir"]
-                            ))
-                    else:
-                        build = True
-
-                    if build:
-                        self._daemon_info_lock.acquire()
-                        self._daemon_info["jobs"].append({
-                            "project": copy.copy(self.projects[i]),
-                            "dc_file": dc_file[:],
-                            "commit": commit[:],
-                            "status": 0,
-                            "container_id": "",
-                            "time_started": 0
-                        })
-
-                        self._daemon_info["scheduled_builds"] += 1
-                        self._daemon_info_lock.release()
-
-    def _process(self, project_info, dc_file):
+            try:
+                changed_files = project["repo"].getChangedFilesBetweenCommits(
+                    old_commit, commit
+                )
+            except GitErrorException:
+                pass
+
+            snapshot = self._createProjectSnapshot(project)
+
+            # determine assigned DC file for each changed file
+            for dc_file, dc_object in project["dc_files"].items():
+                build = False
+
+                if dc_object.rootid:
+                    try:
+                        assigned_files = xslt.getAllUsedFiles(
+                            "{}/xml/{}".format(project["vcs_repodir"], dc_object.main),
+                            dc_object.rootid
+                        )
+
+                        # is at least one element from "changed_files" in "assigned_files"
+                        res = lambda a, b: any(i in assigned_files for i in changed_files)
+
+                        if res:
+                            build = True
+                    except InvalidRootIDException:
+                        log.error("Invalid root id in main file '{}' of DC File '{}' specified. Repository: {}".format(
+                            dc_object.main, dc_file, project["vcs_repodir"]
+                        ))
+                else:
+                    build = True
+
+                if build:
+                    new_jobs.append((snapshot, dc_file, commit))
+
+            # update to the new commit hash - only after the builds are determined, so the
+            # commit gets checked again if something went wrong
+            project["vcs_lastrev"] = commit
+            self.autoBuildConfig.updateCommitHash(project["project"], commit)
+        except Exception as e:
+            log.error("Updating project '%s' failed: %s", project["project"], e)
+            return []
+
+        return new_jobs
+
+    def _createProjectSnapshot(self, project):
+        """Creates a lightweight snapshot of a project for the job list
+
+        :param dict project: The project as returned by AutoBuildConfig.fetchProjects()
+        :return ProjectSnapshot: The snapshot
+        """
+
+        return ProjectSnapshot(
+            vcs_repodir=project["vcs_repodir"],
+            notifications=project["notifications"],
+            project=project["project"],
+            vcs_branch=project["vcs_branch"]
+        )
+
+    def _addJob(self, snapshot, dc_file, commit):
+        """Adds a new job to the job list
+
+        The caller has to hold the jobs lock.
+
+        :param ProjectSnapshot snapshot: The project of the job
+        :param string dc_file: DC what should get built
+        :param string commit: The commit hash to build
+        """
+
+        job_id = next(self._job_id_counter)
+
+        self._daemon_info["jobs"][job_id] = {
+            "job_id": job_id,
+            "project_snapshot": snapshot,
+            "dc_file": dc_file,
+            "commit": commit,
+            "status": 0,
+            "container_id": "",
+            "time_started": 0
+        }
+
+    def _process(self, job_id, project_info, dc_file):
         """Thread function to start containers and build documentations
 
-        :param dict project_info: A dictionary with information about that project
+        :param int job_id: The id of the job in the job list
+        :param ProjectSnapshot project_info: Information about that project
         :param string dc_file: DC what should get built
         """
 
@@ -316,36 +445,57 @@ class Daemon(Action):
             while True:
                 time.sleep(30)
 
-        # create container
         container = Container()
-        container.spawn()
 
-        # save container id in daemon info
-        self._daemon_info_lock.acquire()
+        try:
+            # create container
+            container.spawn()
 
-        for idx, job in enumerate(self._daemon_info["jobs"]):
-            if job["dc_file"] == dc_file and job["status"] == 1:
-                job["container_id"] = container.getContainerID()
-                break
+            # save container id in daemon info
+            with self._jobs_lock:
+                self._daemon_info["jobs"][job_id]["container_id"] = container.getContainerID()
+
+            # prepare container
+            container.prepare(project_info.vcs_repodir)
 
-        self._daemon_info_lock.release()
+            self._buildFormats(container, project_info, dc_file)
+        finally:
+            # remove the job from the job list and free the build slot - also if the build
+            # has failed with an error, otherwise the slot would be lost
+            with self._jobs_cv:
+                self._daemon_info["jobs"].pop(job_id)
+                self._statusChanged()
 
-        # prepare container
-        container.prepare(project_info["vcs_repodir"])
+                self._running_builds.add(-1)
+                self._jobs_cv.notify()
+
+            # kill and delete container from the registry
+            if not self._debug and container.isSpawned():
+                container.kill()
+
+    def _buildFormats(self, container, project_info, dc_file):
+        """Builds all formats of a documentation inside a prepared container
+
+        :param Container container: The prepared container
+        :param ProjectSnapshot project_info: Information about that project
+        :param string dc_file: DC what should get built
+        """
 
         # specify build formats
         build_formats = ["html", "single_html", "pdf"]
 
-        for f in build_formats:
+        # name of the documentation in the output archive names (DC file without "DC-")
+        doc_name = dc_file[3:]
+
+        for build_format in build_formats:
             # building the documentation
-            #pdb.set_trace()
-            result = container.buildDocumentation(dc_file, f)
+            result = container.buildDocumentation(dc_file, build_format)
 
             archive = result["archive_name"]
             del result["archive_name"]
 
             # parse the documentation info
-            product = json.loads(container.execute("cat /tmp/doc_info.json")["stdout"])
+            product = loadJSON(container.execute("cat /tmp/doc_info.json")["stdout"])
 
             # add new information to result dict
             result.update(product)
@@ -359,51 +509,35 @@ class Daemon(Action):
                 # is disabled
                 del result["dapscmd"]
     
-            if result["build_status"]:
-                # generate a build info file for the documentation archive
-                container.fileCreate("/tmp/build_info.json", json.dumps(result))
+            now = int(time.time())
 
-                # add build info file to documentation archive
-                container.execute("tar -C /tmp --append --file={} build_info.json".format(archive))
-
-                # compress tar archive
-                container.execute("gzip {}".format(archive))
+            if result["build_status"]:
+                # generate a build info file, add it to the documentation archive and compress
+                # the archive - all in one go, the build info is passed via stdin
+                script = "cat > /tmp/build_info.json && " \
+                    "tar -C /tmp --append --file={0} build_info.json && gzip {0}".format(
+                        shlex.quote(archive)
+                    )
+                container.execute("sh -c {}".format(shlex.quote(script)), stdin=dumpJSON(result))
 
                 # copy compiled documentation into the builds/ directory of the user
-                file_name = "{}_{}_{}.tar.gz".format(int(time.time()), dc_file[3:], f.replace("_", "-"))
-                container.fetch("{}.gz".format(archive), "{}/{}".format(
-                    BUILDS_DIR, file_name
-                ))
-
-                self._irclock.acquire()
-
-                if self._ircbot and self._irc_config["irc_inform_build_success"]:
-                    message = "A new build has been finished on {}! DC-File: {}, Format: {}," \
-                        " Output-Archive: {}".format(
-                            self._hostname,
-                            result["dc_file"],
-                            result["format"],
-                            file_name
-                        )
-
-                    for client in project_info["notifications"]["irc"]:
-                        self._ircbot.sendClientMessage(client, message)
+                file_name = "{}_{}_{}.tar.gz".format(now, doc_name, build_format.replace("_", "-"))
+                container.fetch(archive + ".gz", os.path.join(BUILDS_DIR, file_name))
 
-                    if self._irc_config["irc_channel_messages"]:
-                        self._ircbot.sendChannelMessage(message)
-
-                self._irclock.release()
+                # notify in the background, so the next format can be built right away
+                future = self._notify_pool.submit(
+                    self._notifyBuildSuccess, project_info, result["dc_file"], result["format"],
+                    file_name
+                )
+                future.add_done_callback(self._notificationDone)
             else:
                 error_log_name = "build_fail_{}_{}_{}".format(
                     result["dc_file"],
                     result["format"],
-                    int(time.time())
+                    now
                 )
 
-                error_log_path = "{}/{}.log".format(
-                    LOG_DIR,
-                    error_log_name
-                )
+                error_log_path = os.path.join(LOG_DIR, error_log_name + ".log")
 
                 if self._logserver:
                     irc_path = "http://{}:{}/logs/{}".format(
@@ -414,45 +548,86 @@ class Daemon(Action):
                 else:
                     irc_path = error_log_path
 
-                with open(error_log_path, "w+") as f:
-                    f.write(result["build_log"])
+                container.fetchBuildLog(error_log_path)
 
-                self._irclock.acquire()
+                # notify in the background, so the next format can be built right away
+                future = self._notify_pool.submit(
+                    self._notifyBuildFailure, project_info, result["dc_file"], result["format"],
+                    irc_path
+                )
+                future.add_done_callback(self._notificationDone)
 
-                if self._ircbot and self._irc_config["irc_inform_build_fail"]:
-                    message = "A build has failed on {}! DC-File: {}, Format: {}, " \
-                        "Error-Log: {}".format(
-                            self._hostname,
-                            result["dc_file"],
-                            result["format"],
-                            irc_path
-                        )
+            # execute cleanup script
+            container.cleanup()
 
-                    for client in project_info["notifications"]["irc"]:
-                        self._ircbot.sendClientMessage(client, message)
+    def _notifyBuildSuccess(self, project_info, dc_file, build_format, file_name):
+        """Informs the IRC clients of a project about a successful build
 
-                    if self._irc_config["irc_channel_messages"]:
-                        self._ircbot.sendChannelMessage(message)
+        :param ProjectSnapshot project_info: Information about that project
+        :param string dc_file: The DC file what got built
+        :param string build_format: The format what got built
+        :param string file_name: The name of the output archive
+        """
 
-                self._irclock.release()
+        if not self._ircbot or not self._irc_inform_success:
+            return
 
-            # execute cleanup script
-            container.cleanup()
+        message = "A new build has been finished on {}! DC-File: {}, Format: {}, " \
+            "Output-Archive: {}".format(self._hostname, dc_file, build_format, file_name)
 
-        # update amount of running builds
-        self._daemon_info_lock.acquire()
+        self._sendIRCNotification(project_info, message)
 
-        self._daemon_info["running_builds"] -= 1
-        for idx, job in enumerate(self._daemon_info["jobs"]):
-            if job["dc_file"] == dc_file and job["status"] == 1:
-                self._daemon_info["jobs"].pop(idx)
-                break
+    def _notifyBuildFailure(self, project_info, dc_file, build_format, log_path):
+        """Informs the IRC clients of a project about a failed build
 
-        self._daemon_info_lock.release()
+        :param ProjectSnapshot project_info: Information about that project
+        :param string dc_file: The DC file what got built
+        :param string build_format: The format what got built
+        :param string log_path: Path or URL of the error log
+        """
 
-        # kill and delete container from the registry
-        if not self._debug:
-            container.kill()
+        if not self._ircbot or not self._irc_inform_fail:
+            return
+
+        message = "A build has failed on {}! DC-File: {}, Format: {}, " \
+            "Error-Log: {}".format(self._hostname, dc_file, build_format, log_path)
+
+        self._sendIRCNotification(project_info, message)
+
+    def _sendIRCNotification(self, project_info, message):
+        """Sends a message to the IRC clients of a project and to the channel if enabled
+
+        :param ProjectSnapshot project_info: Information about that project
+        :param string message: The message to be sent
+        """
+
+        # the lock only guards the connection of the bot, which is shared with its own thread
+        with self._irclock:
+            for client in project_info.notifications["irc"]:
+                self._ircbot.sendClientMessage(client, message)
+
+            if self._irc_channel_messages:
+                self._ircbot.sendChannelMessage(message)
+
+    def _buildDone(self, future):
+        """Reports errors of a finished build worker
+
+        :param concurrent.futures.Future future: The future of the build
+        """
+
+        error = future.exception()
+        if error:
+            log.error("Build worker failed: %s", error)
+
+    def _notificationDone(self, future):
+        """Reports errors of a sent build notification
+
+        :param concurrent.futures.Future future: The future of the notification
+        """
+
+        error = future.exception()
+        if error:
+            log.error("Sending build notification failed: %s", error)
 
     def _print(self, message):
         """Prints messages to the CLI
@@ -468,30 +643,26 @@ class Daemon(Action):
         :return list: A list of all successfully triggered project builds
         """
 
-        self._daemon_info_lock.acquire()
-
         valid_projects = []
+        scheduled = 0
 
-        for requested_project in set(projects):
-            for idx in self.projects:
-                project = self.projects[idx]
-                if requested_project == project["project"]:
-                    for dc_file in project["dc_files"]:
-                        self._daemon_info["jobs"].append({
-                            "project": copy.copy(project),
-                            "dc_file": dc_file,
-                            "commit": project["vcs_lastrev"],
-                            "status": 0,
-                            "container_id": "",
-                            "time_started": 0
-                        })
-
-                        self._daemon_info["scheduled_builds"] += 1
-
-                    valid_projects.append(project["project"])
-                    break
+        with self._jobs_cv:
+            for requested_project in set(projects):
+                for idx in self.projects:
+                    project = self.projects[idx]
+                    if requested_project == project["project"]:
+                        snapshot = self._createProjectSnapshot(project)
+
+                        for dc_file in project["dc_files"]:
+                            self._addJob(snapshot, dc_file, project["vcs_lastrev"])
+                            scheduled += 1
+
+                        valid_projects.append(project["project"])
+                        break
 
-        self._daemon_info_lock.release()
+            self._scheduled_builds.add(scheduled)
+            self._statusChanged()
+            self._jobs_cv.notify_all()
 
         return valid_projects
 
@@ -508,18 +679,14 @@ class Daemon(Action):
             for idx in self.projects:
                 project = self.projects[idx]
                 if dc_file in project["dc_files"]:
-                    self._daemon_info_lock.acquire()
-                    self._daemon_info["jobs"].append({
-                        "project": copy.copy(self.projects[idx]),
-                        "dc_file": dc_file[:],
-                        "commit": project["vcs_lastrev"],
-                        "status": 0,
-                        "container_id": "",
-                        "time_started": 0
-                    })
+                    with self._jobs_cv:
+                        self._addJob(
+                            self._createProjectSnapshot(project), dc_file, project["vcs_lastrev"]
+                        )
 
-                    self._daemon_info["scheduled_builds"] += 1
-                    self._daemon_info_lock.release()
+                        self._scheduled_builds.add(1)
+                        self._statusChanged()
+                        self._jobs_cv.notify_all()
 
                     valid_dcs.append(dc_file)
                     break
@@ -527,20 +694,29 @@ class Daemon(Action):
         return valid_dcs
 
     def getJobList(self):
-        result = []
-
-        self._daemon_info_lock.acquire()
-        for job in self._daemon_info["jobs"]:
-            result.append({
-                "project": job["project"]["project"],
-                "branch": job["project"]["vcs_branch"],
-                "dc_file": job["dc_file"],
-                "status": job["status"],
-                "commit": job["commit"],
-                "time_started": job["time_started"],
-                "status": job["status"]
-            })
-        self._daemon_info_lock.release()
+        """Returns a list of all scheduled and running jobs
+
+        The list is shared between all callers until the job list changes, so it must not be
+        modified.
+
+        :return list: A list of dictionaries with information about each job
+        """
+
+        with self._jobs_lock:
+            if self._job_list_cache is None:
+                self._job_list_cache = []
+
+                for job in self._daemon_info["jobs"].values():
+                    self._job_list_cache.append({
+                        "project": job["project_snapshot"].project,
+                        "branch": job["project_snapshot"].vcs_branch,
+                        "dc_file": job["dc_file"],
+                        "status": job["status"],
+                        "commit": job["commit"],
+                        "time_started": job["time_started"]
+                    })
+
+            result = self._job_list_cache
 
         return result
 
@@ -557,6 +733,38 @@ class Daemon(Action):
     def auth(self):
         return self._auth
 
+    def addStatusListener(self, callback):
+        """Registers a callback which gets invoked whenever the job list changes
+
+        The callback is called while the jobs lock is held, so it must not block and must not
+        call back into the daemon.
+
+        :param callable callback: A function without arguments
+        """
+
+        self._status_listeners.append(callback)
+
+    def _statusChanged(self):
+        """Marks the job list as changed and informs all status listeners
+
+        The caller has to hold the jobs lock.
+        """
+
+        self._status_version += 1
+        self._job_list_cache = None
+
+        for callback in self._status_listeners:
+            callback()
+
+    @property
+    def statusVersion(self):
+        """Returns a number which changes whenever the job list changes
+
+        :return int: The current status version
+        """
+
+        return self._status_version
+
     def loadAutoBuildConfig(self, path):
         """Loads the auto build config file into memory and parses it
 
@@ -588,7 +796,12 @@ class Daemon(Action):
             self._max_containers = DAEMON_DEFAULT_MAX_CONTAINERS
 
         # api_server
-        self._api_server = configmanager.get_prop("api_server")
+        api_server = (configmanager.get_prop("api_server") or "").lower()
+        if api_server and api_server not in ("true", "false"):
+            log.warning("Invalid value '%s' for 'api_server' in the configuration. The API " \
+                "server will not be started.", api_server)
+
+        self._api_server_enabled = api_server == "true"
 
         # api_server_port
         try:
@@ -601,16 +814,13 @@ class Daemon(Action):
         """
 
         # check if user is in docker group
-        user = pwd.getpwuid(os.getuid()).pw_name
-        user_in_group = False
-
-        for group in grp.getgrall():
-            if group.gr_name == "docker":
-                if user in group.gr_mem:
-                    user_in_group = True
-                    break
+        try:
+            docker_group = grp.getgrnam("docker")
+        except KeyError:
+            raise UserNotInDockerGroupException()
 
-        if not user_in_group:
+        user = pwd.getpwuid(os.getuid()).pw_name
+        if user not in docker_group.gr_mem and docker_group.gr_gid not in os.getgroups():
             raise UserNotInDockerGroupException()
 
         # check if the docker image is imported
@@ -618,11 +828,14 @@ class Daemon(Action):
             raise DockerImageMissingException(CONTAINER_IMAGE)
 
     def getStatus(self):
-        self._daemon_info_lock.acquire()
-        daemon_info = self._daemon_info.copy()
-        self._daemon_info_lock.release()
+        with self._jobs_lock:
+            jobs = list(self._daemon_info["jobs"].values())
 
-        return daemon_info
+        return {
+            "jobs": jobs,
+            "running_builds": self._running_builds.get(),
+            "scheduled_builds": self._scheduled_builds.get()
+        }
 
     def loadIRCBotConfig(self):
         self._irc_config["irc_server"] = configmanager.get_prop("irc_server")
@@ -630,9 +843,8 @@ class Daemon(Action):
         self._irc_config["irc_channel"] = "#{}".format(configmanager.get_prop("irc_channel"))
         self._irc_config["irc_bot_nickname"] = configmanager.get_prop("irc_bot_nickname")
         self._irc_config["irc_bot_username"] = configmanager.get_prop("irc_bot_username")
-        self._irc_config["irc_inform_build_success"] = True if \
-            configmanager.get_prop("irc_inform_build_success") == "true" else False
-        self._irc_config["irc_inform_build_fail"] = True if \
-            configmanager.get_prop("irc_inform_build_fail") == "true" else False
-        self._irc_config["irc_channel_messages"] = True if \
-            configmanager.get_prop("irc_channel_messages") == "true" else False
+
+        # notification settings are needed for every build, so keep them as plain attributes
+        self._irc_inform_success = configmanager.get_prop("irc_inform_build_success") == "true"
+        self._irc_inform_fail = configmanager.get_prop("irc_inform_build_fail") == "true"
+        self._irc_channel_messages = configmanager.get_prop("irc_channel_messages") == "true"
@@ -46,16 +46,15 @@ class Status(Action):
         if self._error:
             sys.exit(self._error)
 
-    @asyncio.coroutine
-    def start_client(self):
+    async def start_client(self):
         try:
-            ws = yield from websockets.connect("ws://{}:{}/".format(self._ip, self._port))
+            ws = await websockets.connect("ws://{}:{}/".format(self._ip, self._port))
 
             # request status information packet
-            yield from ws.send(json.dumps({ "id": 1 }))
+            await ws.send(json.dumps({ "id": 1 }))
 
             # fetch server message
-            res = yield from ws.recv()
+            res = await ws.recv()
             try:
                 res = json.loads(res)
 
@@ -54,10 +54,9 @@ class Triggerbuild(Action):
         if self._error:
             sys.exit(self._error)
 
-    @asyncio.coroutine
-    def start_client(self):
+    async def start_client(self):
         try:
-            ws = yield from websockets.connect("ws://{}:{}/".format(self._ip, self._port))
+            ws = await websockets.connect("ws://{}:{}/".format(self._ip, self._port))
 
             if not self._dc_files:
                 self._dc_files = []
@@ -66,13 +65,13 @@ class Triggerbuild(Action):
                 self._projects = []
 
             # request status information packet
-            yield from ws.send(json.dumps({
+            await ws.send(json.dumps({
                 "id": 2, "token": getToken(), "dc_files": self._dc_files,
                 "projects": self._projects
             }))
 
             # fetch server message
-            res = yield from ws.recv()
+            res = await ws.recv()
             try:
                 res = json.loads(res)
 
@@ -49,18 +49,17 @@ class Viewlog(Action):
         if self._error:
             sys.exit(self._error)
 
-    @asyncio.coroutine
-    def start_client(self):
+    async def start_client(self):
         try:
-            ws = yield from websockets.connect("ws://{}:{}/".format(self._ip, self._port))
+            ws = await websockets.connect("ws://{}:{}/".format(self._ip, self._port))
 
             # request status information packet
-            yield from ws.send(json.dumps({
+            await ws.send(json.dumps({
                 "id": 4, "dc_file": self._dc_file, "format": self._format_name
             }))
 
             # fetch server message
-            res = yield from ws.recv()
+            res = await ws.recv()
 
             try:
                 res = json.loads(res)
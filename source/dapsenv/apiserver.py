@@ -21,11 +21,11 @@ import dapsenv.api.status as APIStatus
 import dapsenv.api.triggerbuild as APITriggerBuild
 import dapsenv.api.projectlist as APIProjectList
 import dapsenv.api.viewlog as APIViewLog
-import json
 import threading
 import websockets
 from dapsenv.exceptions import APIInvalidRequestException, APIUnauthorizedTokenException, \
                                APIErrorException
+from dapsenv.utils import dumpJSON, loadJSON
 
 class APIServer:
 
@@ -33,6 +33,9 @@ class APIServer:
         self._ip = ip
         self._port = port
         self._daemon = daemon
+        self._status_cache = None
+        self._subscribers = set()
+        self._loop = None
 
     def serve(self):
         thread = threading.Thread(target=self._serve)
@@ -42,6 +45,10 @@ class APIServer:
         # set event loop handler
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self._loop = loop
+
+        # push status updates to subscribed clients
+        self._daemon.addStatusListener(self._onStatusChanged)
 
         # configure websocket server
         start_server = websockets.serve(self._api_server_runtime, self._ip, self._port)
@@ -50,8 +57,7 @@ class APIServer:
         asyncio.get_event_loop().run_until_complete(start_server)
         asyncio.get_event_loop().run_forever()
 
-    @asyncio.coroutine
-    def _api_server_runtime(self, websocket, path):
+    async def _api_server_runtime(self, websocket, path):
         """This coroutine will be created for each new client what connects to the API server
 
         :param websockets.server.WebSocketServerProtocol websocket: Object for communicating with
@@ -63,27 +69,32 @@ class APIServer:
             try:
                 # wait until the client sends data to the API server
                 try:
-                    data = yield from websocket.recv()
+                    data = await websocket.recv()
                 except websockets.exceptions.ConnectionClosed:
                     return
 
                 try:
                     # parse the sent data as json
-                    data = json.loads(data)
+                    data = loadJSON(data)
 
                     # check for correct data packets
                     if not "id" in data:
-                        yield from websocket.close()
+                        await websocket.close()
                         return
+                    elif data["id"] == 1:
+                        if data.get("subscribe"):
+                            # from now on the client only receives status updates
+                            await self._subscribeStatus(websocket, data)
+                            return
+
+                        # status query - answered from the cache if nothing has changed
+                        await websocket.send(self._getStatusResponse(data))
                     else:
                         response = { "id": data["id"] }
 
-                        # status query
                         try:
-                            if data["id"] == 1:
-                                response.update(APIStatus.handle(data, self._daemon))
                             # trigger new build
-                            elif data["id"] == 2:
+                            if data["id"] == 2:
                                 response.update(APITriggerBuild.handle(data, self._daemon))
                             # project list
                             elif data["id"] == 3:
@@ -93,10 +104,10 @@ class APIServer:
                                 response.update(APIViewLog.handle(data, self._daemon))
                             else:
                                 # close if an invalid packet was sent
-                                yield from websocket.close()
+                                await websocket.close()
                                 return
                         except APIInvalidRequestException:
-                            yield from websocket.close()
+                            await websocket.close()
                             return
                         except APIUnauthorizedTokenException:
                             response.update({"error": "Access denied! Unauthorized token!"})
@@ -104,10 +115,97 @@ class APIServer:
                             response.update({ "error": e.message })
 
                         # send response
-                        yield from websocket.send(json.dumps(response))
+                        await websocket.send(dumpJSON(response))
 
                 except ValueError:
-                    yield from websocket.close()
+                    await websocket.close()
                     return
             except ConnectionResetError:
                 return
+
+    def _getStatusResponse(self, data):
+        """Returns the serialized answer for a status query
+
+        The answer is only rebuilt if the job list of the daemon has changed since the last
+        status query.
+
+        :param dict data: The request sent by the client
+        :return string: The JSON encoded response
+        """
+
+        # read the version first, so the cache never holds older data than its version says
+        version = self._daemon.statusVersion
+
+        if self._status_cache is None or self._status_cache[0] != version:
+            response = { "id": 1 }
+            response.update(APIStatus.handle(data, self._daemon))
+            self._status_cache = (version, dumpJSON(response))
+
+        return self._status_cache[1]
+
+    async def _subscribeStatus(self, websocket, data):
+        """Sends the current status to a client and pushes every change afterwards
+
+        :param websockets.server.WebSocketServerProtocol websocket: Object for communicating with
+                                                                    the current client
+        :param dict data: The request sent by the client
+        """
+
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+
+        # watch the connection, so a disconnected client is noticed while the daemon is idle
+        receiver = asyncio.ensure_future(websocket.recv())
+        getter = None
+
+        try:
+            response = self._getStatusResponse(data)
+
+            while True:
+                await websocket.send(response)
+
+                getter = asyncio.ensure_future(queue.get())
+
+                while not getter.done():
+                    done, _ = await asyncio.wait(
+                        [getter, receiver], return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    if receiver in done:
+                        # raises ConnectionClosed if the client has disconnected - other
+                        # messages are ignored while the client is subscribed
+                        receiver.result()
+                        receiver = asyncio.ensure_future(websocket.recv())
+
+                response = getter.result()
+
+                # every update contains the full status, so only the latest one is of interest
+                while not queue.empty():
+                    response = queue.get_nowait()
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            receiver.cancel()
+            if getter:
+                getter.cancel()
+
+            self._subscribers.discard(queue)
+
+    def _onStatusChanged(self):
+        """Status listener of the daemon - called from the daemon threads
+        """
+
+        if self._subscribers:
+            self._loop.call_soon_threadsafe(self._publishStatus)
+
+    def _publishStatus(self):
+        """Queues the current status for all subscribed clients
+        """
+
+        if not self._subscribers:
+            return
+
+        response = self._getStatusResponse({ "id": 1 })
+
+        for queue in self._subscribers:
+            queue.put_nowait(response)
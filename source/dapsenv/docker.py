@@ -16,16 +16,14 @@
 # To contact SUSE about this file by physical or electronic mail,
 # you may find current contact information at www.suse.com
 
-import os
 import shlex
 import subprocess
 import time
 from collections import OrderedDict
 from dapsenv.exceptions import ContainerNotSpawnedException, ContainerAlreadySpawnedException, \
                                ContainerPreparationMissingException, \
-                               UnexpectedStderrOutputException, ContainerFileCreationFailed
-from dapsenv.general import CONTAINER_REPO_DIR, CONTAINER_IMAGE, SOURCE_DIR, HOME_DIR
-from random import randint
+                               UnexpectedStderrOutputException
+from dapsenv.general import CONTAINER_REPO_DIR, CONTAINER_IMAGE, SOURCE_DIR
 
 class Container:
 
@@ -69,6 +67,14 @@ class Container:
         self._container_id = ""
         self._container_repopath = ""
 
+    def isSpawned(self):
+        """Checks if the container has been spawned
+
+        :return bool: True if the container is running
+        """
+
+        return self._spawned
+
     def getContainerID(self):
         """Returns the ID of this container
 
@@ -129,26 +135,34 @@ class Container:
             "/tmp/build.sh is not available inside the container."
         )
 
-    def execute(self, command):
+    def execute(self, command, stdin=None):
         """Executes a command inside a container
 
         :param string command: The command
+        :param string stdin: Data which gets passed to the standard input of the command
         :return dict: With 'stdout' and 'stderr' as keys
         """
 
         if not self._spawned:
             raise ContainerNotSpawnedException()
 
-        cmd = "docker exec {} {}".format(self.getContainerID(), command)
+        cmd = "docker exec {}{} {}".format(
+            "-i " if stdin is not None else "", self.getContainerID(), command
+        )
         process = subprocess.Popen(
             shlex.split(cmd),
+            stdin=subprocess.PIPE if stdin is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
 
+        stdout, stderr = process.communicate(
+            stdin.encode("utf-8") if stdin is not None else None
+        )
+
         output = {
-            "stdout": process.stdout.read().decode("utf-8"),
-            "stderr": process.stderr.read().decode("utf-8")
+            "stdout": stdout.decode("utf-8"),
+            "stderr": stderr.decode("utf-8")
         }
 
         return output
@@ -199,41 +213,6 @@ class Container:
 
         return False
 
-    def fileCreate(self, file_name, content):
-        """Creates a file inside the container
-
-        :param string file_name: The file path
-        :param string content: The content of the file
-        """
-
-        if not self._spawned:
-            raise ContainerNotSpawnedException()
-
-        tmp_file_name = "container_file_creation_{}".format(randint(10000000,99999999))
-        tmp_file_path = "{}/tmp/{}".format(HOME_DIR, tmp_file_name)
-
-        # write tmp file
-        with open(tmp_file_path, "w") as f:
-            f.write(content)
-
-        # copy file into the container
-        self.put(tmp_file_path, file_name)
-
-        # wait until the file has been copied into the container
-        count = 0
-        while count < 10:
-            if self.fileAvailable(file_name):
-                break
-
-            count += 1
-            time.sleep(1)
-
-        if count == 10:
-            raise ContainerFileCreationFailed(file_name)
-
-        # remove temporary file
-        os.remove(tmp_file_path)
-
     def buildDocumentation(self, dc_file, build_format):
         """Tries to build the documentation
 
@@ -266,13 +245,6 @@ class Container:
         if status["stderr"]:
             raise UnexpectedStderrOutputException(cmd, status["stderr"])
 
-        # get build output
-        log = self.execute("cat /tmp/build_log")
-
-        # raise exception if something went wrong with the last command
-        if log["stderr"]:
-            raise UnexpectedStderrOutputException(cmd, log["stderr"])
-
         # determine if the build was successful or not
         if "success" in status["stdout"]:
             result = True
@@ -282,13 +254,38 @@ class Container:
         # save data to dict
         data["dc_file"] = dc_file
         data["format"] = build_format
-        data["build_log"] = log["stdout"]
         data["build_status"] = result
         data["compile_time"] = int(time.time()) - start
         data["archive_name"] = "/tmp/documentation_{}.tar".format(build_format)
 
         return data
 
+    def fetchBuildLog(self, destination):
+        """Writes the log of the last build into a local file
+
+        The log is streamed from the container directly into the file, so it is never held in
+        memory as a whole.
+
+        :param string destination: The path of the local file
+        """
+
+        if not self._spawned:
+            raise ContainerNotSpawnedException()
+
+        cmd = "docker exec {} cat /tmp/build_log".format(self.getContainerID())
+
+        with open(destination, "wb") as log_file:
+            process = subprocess.Popen(
+                shlex.split(cmd),
+                stdout=log_file,
+                stderr=subprocess.PIPE
+            )
+            _, stderr = process.communicate()
+
+        # raise exception if something went wrong with the last command
+        if stderr:
+            raise UnexpectedStderrOutputException(cmd, stderr.decode("utf-8"))
+
     def cleanup(self):
         """Cleans the container from temporary files
         """
@@ -139,16 +139,6 @@ class GitErrorException(DapsEnvException):
     def __str__(self):
         log.error("Could not execute '%s': %s", self.command, self.stderr)
 
-class ContainerFileCreationFailed(DapsEnvException):
-    def __init__(self, file_name):
-        self.file_name = file_name
-        self.message = "Internal Error: File '{}' could not be created inside a container!".format(
-            file_name
-        )
-
-    def __str__(self):
-        log.error(self.message)
-
 class DockerRegisteryException(DapsEnvException):
     def __init__(self, message):
         self.message = message
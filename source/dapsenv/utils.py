@@ -16,8 +16,16 @@
 # To contact SUSE about this file by physical or electronic mail,
 # you may find current contact information at www.suse.com
 
+import json
 import random
 import string
+import threading
+
+# orjson is optional - it is a lot faster than the json module of the standard library
+try:
+	import orjson
+except ImportError:
+	orjson = None
 
 def randomString(len):
 	"""Generates a random string
@@ -28,3 +36,60 @@ def randomString(len):
 	
 	return "".join(random.SystemRandom().choice(string.ascii_letters + string.digits) \
 		for _ in range(len))
+
+def dumpJSON(obj):
+	"""Serializes an object to a JSON string
+
+	:param object obj: The object to serialize
+	:return string: The JSON document
+	"""
+
+	if orjson:
+		return orjson.dumps(obj).decode("utf-8")
+
+	return json.dumps(obj)
+
+def loadJSON(data):
+	"""Parses a JSON document
+
+	:param string data: The JSON document (str or bytes)
+	:return object: The parsed object
+	:raises ValueError: If the document is not valid JSON
+	"""
+
+	if orjson:
+		return orjson.loads(data)
+
+	return json.loads(data)
+
+class AtomicInt:
+	"""A thread-safe integer counter
+	"""
+
+	def __init__(self, value=0):
+		"""Initializes the counter
+
+		:param int value: The initial value
+		"""
+
+		self._value = value
+		self._lock = threading.Lock()
+
+	def get(self):
+		"""Returns the current value of the counter
+
+		:return int: The current value
+		"""
+
+		return self._value
+
+	def add(self, value):
+		"""Adds a value to the counter
+
+		:param int value: The value to add (may be negative)
+		:return int: The new value of the counter
+		"""
+
+		with self._lock:
+			self._value += value
+			return self._value
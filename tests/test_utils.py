@@ -0,0 +1,45 @@
+import pytest
+import threading
+from collections import OrderedDict
+from dapsenv.utils import AtomicInt, dumpJSON, loadJSON
+
+
+# it adds and subtracts values
+def test_atomic_int_add():
+    counter = AtomicInt()
+
+    assert counter.add(3) == 3
+    assert counter.add(-1) == 2
+    assert counter.get() == 2
+
+
+# it does not lose updates when used by multiple threads
+def test_atomic_int_threads():
+    counter = AtomicInt(10)
+
+    def worker():
+        for _ in range(1000):
+            counter.add(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.get() == 4010
+
+
+# it serializes to a string and parses it back
+def test_json_roundtrip():
+    data = OrderedDict([("id", 1), ("jobs", [{"dc_file": "DC-test", "status": 0}])])
+    encoded = dumpJSON(data)
+
+    assert isinstance(encoded, str)
+    assert loadJSON(encoded) == data
+
+
+# it raises a ValueError on invalid documents
+def test_json_invalid():
+    with pytest.raises(ValueError):
+        loadJSON("{invalid")